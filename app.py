@@ -1,39 +1,48 @@
 import streamlit as st
-from web.styles.style import apply_custom_styling
-from web.ui.screens import setup_screen, visualization_screen
+
+
+PAGE_CONFIG = {
+    'page_title': "🤖 Pathfinding Visualizer",
+    'page_icon': "🤖",
+    'layout': "wide",
+    'initial_sidebar_state': "expanded",
+}
 
 
 def configure_page():
     """Configure Streamlit page settings"""
-    st.set_page_config(
-        page_title="🤖 Pathfinding Visualizer",
-        page_icon="🤖",
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
+    st.set_page_config(**PAGE_CONFIG)
+
+
+SESSION_DEFAULTS = {
+    'env': None,
+    'robot': None,
+    'problem': None,
+    'result': None,
+    'algorithm': None,
+    'setup_complete': False,
+}
 
 
 def initialize_session_state():
     """Initialize Streamlit session state variables"""
-    if 'env' not in st.session_state:
-        st.session_state.env = None
-    if 'robot' not in st.session_state:
-        st.session_state.robot = None
-    if 'problem' not in st.session_state:
-        st.session_state.problem = None
-    if 'result' not in st.session_state:
-        st.session_state.result = None
-    if 'algorithm' not in st.session_state:
-        st.session_state.algorithm = None
-    if 'setup_complete' not in st.session_state:
-        st.session_state.setup_complete = False
+    # Defaults only need setting once per session, skip on later reruns
+    if st.session_state.get('_initialized'):
+        return
+    missing = {key: default for key, default in SESSION_DEFAULTS.items()
+               if key not in st.session_state}
+    missing['_initialized'] = True
+    st.session_state.update(missing)
 
 
 def main():
     """Main application entry point - handles routing between screens"""
-    # Configure page
+    # Configure page first so the tab title/icon show before heavier imports
     configure_page()
-    
+
+    from web.styles.style import apply_custom_styling
+    from web.ui.screens import setup_screen, visualization_screen
+
     # Apply custom styling
     apply_custom_styling()
     
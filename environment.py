@@ -9,7 +9,7 @@ class Environment:
         self.has_border = has_border
         
         # Initialize grid with all free space
-        self.grid = np.zeros((height, width), dtype=int)
+        self.grid = np.zeros((height, width), dtype=np.uint8)
         
         # Add borders if requested
         if has_border:
@@ -18,6 +18,10 @@ class Environment:
         # States will be set later
         self.initial_state = None
         self.goal_state = None
+
+        # Neighbor lists memoized per cell for the motion model last queried
+        self._neighbor_cache = {}
+        self._neighbor_cache_model = None
     
     def _add_borders(self):
         # Add obstacle borders around the environment.
@@ -31,17 +35,33 @@ class Environment:
 
         if 0 <= x < self.width and 0 <= y < self.height:
             self.grid[y, x] = 1
+            self._invalidate_neighbors()
+    
+    def add_obstacles(self, xs, ys):
+        # Add many obstacles at once from parallel x and y coordinate arrays.
+
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        inside = (0 <= xs) & (xs < self.width) & (0 <= ys) & (ys < self.height)
+        self.grid[ys[inside], xs[inside]] = 1
+        self._invalidate_neighbors()
     
     def add_obstacle_rectangle(self, x_start, y_start, width, height):
 
-        for y in range(y_start, min(y_start + height, self.height)):
-            for x in range(x_start, min(x_start + width, self.width)):
-                self.grid[y, x] = 1
+        # Clip to the grid, then fill the whole block with one slice assignment
+        y_end = min(y_start + height, self.height)
+        x_end = min(x_start + width, self.width)
+        y_start = max(y_start, 0)
+        x_start = max(x_start, 0)
+        if y_start < y_end and x_start < x_end:
+            self.grid[y_start:y_end, x_start:x_end] = 1
+            self._invalidate_neighbors()
     
     def remove_obstacle(self, x, y):
 
         if 0 <= x < self.width and 0 <= y < self.height:
             self.grid[y, x] = 0
+            self._invalidate_neighbors()
     
     def is_free(self, x, y):
         
@@ -72,25 +92,44 @@ class Environment:
     
     def get_neighbors(self, state, motion_model):
         # Get valid neighboring states based on motion model.
+        # Memoized per cell: searches (tree search especially) expand the same
+        # cells many times, and the answer only changes with the obstacles.
+
+        if motion_model is not self._neighbor_cache_model:
+            self._neighbor_cache = {}
+            self._neighbor_cache_model = motion_model
+
+        neighbors = self._neighbor_cache.get(state)
+        if neighbors is None:
+            neighbors = self._compute_neighbors(state, motion_model)
+            self._neighbor_cache[state] = neighbors
+        return neighbors
+
+    def _compute_neighbors(self, state, motion_model):
+        # Uncached neighbor computation, returned as a tuple so the cached
+        # value can be shared safely between callers.
 
         x, y = state
+        grid = self.grid
+        width, height = self.width, self.height
         neighbors = []
 
         for action in motion_model:
             dx, dy, cost = action
             next_x, next_y = x + dx, y + dy
 
-            # Check if destination is valid
-            if not self.is_valid(next_x, next_y):
+            # Check if destination is valid (is_valid inlined, this runs per expansion)
+            if not (0 <= next_x < width and 0 <= next_y < height) or grid[next_y, next_x] != 0:
                 continue
 
             # For diagonal moves (both dx and dy are non-zero),
             # check that the robot can't squeeze through diagonal obstacles
             if dx != 0 and dy != 0:
                 # Check the two adjacent cells that form the "corridor" for this diagonal move
-                # The robot can only move diagonally if at least one of these cells is free
-                adjacent1_free = self.is_free(x + dx, y)  # Move horizontally first
-                adjacent2_free = self.is_free(x, y + dy)  # Move vertically first
+                # The robot can only move diagonally if at least one of these cells is free.
+                # Both are in bounds since the current and destination cells are.
+                adjacent1_free = grid[y, x + dx] == 0  # Move horizontally first
+                adjacent2_free = grid[y + dy, x] == 0  # Move vertically first
 
                 # Allow diagonal move only if at least one path is clear
                 if not (adjacent1_free or adjacent2_free):
@@ -98,13 +137,18 @@ class Environment:
 
             neighbors.append(((next_x, next_y), action, cost))
 
-        return neighbors
+        return tuple(neighbors)
+
+    def _invalidate_neighbors(self):
+        # Drop memoized neighbors after the obstacle layout changes.
+        self._neighbor_cache = {}
     
     def clear_obstacles(self):
         # Clear all obstacles (except borders if enabled).
-        self.grid = np.zeros((self.height, self.width), dtype=int)
+        self.grid = np.zeros((self.height, self.width), dtype=np.uint8)
         if self.has_border:
             self._add_borders()
+        self._invalidate_neighbors()
     
     def get_grid_copy(self):
 
@@ -10,6 +10,9 @@ class Node:
         depth: Depth of the node in the search tree
     """
     
+    # Searches create one Node per generated successor, so skip the per-instance dict
+    __slots__ = ('state', 'parent', 'action', 'path_cost', 'depth')
+    
     def __init__(self, state, parent=None, action=None, path_cost=0):
         
         self.state = state
@@ -38,13 +41,16 @@ class Node:
         return self.path_cost < other.path_cost
     
     def get_path(self):
-        # List of states from initial to current
-        path = []
+        # List of states from initial to current.
+        # depth gives the length up front, so fill back to front without reversing.
+        path = [None] * (self.depth + 1)
         current = self
+        i = self.depth
         while current is not None:
-            path.append(current.state)
+            path[i] = current.state
             current = current.parent
-        return list(reversed(path))
+            i -= 1
+        return path
     
     def get_actions(self):
         # List of actions from initial to current
@@ -53,4 +59,4 @@ class Node:
         while current.parent is not None:
             actions.append(current.action)
             current = current.parent
-        return list(reversed(actions))
+        return actions[::-1]
@@ -1,3 +1,5 @@
+import math
+import numpy as np
 from node import Node
 
 class PathfindingProblem:
@@ -16,6 +18,8 @@ class PathfindingProblem:
         self.robot = robot
         self.initial_state = environment.initial_state
         self.goal_state = environment.goal_state
+        self._actions = robot.get_possible_actions()  # Fixed for the problem's lifetime
+        self._heuristic_tables = {}  # (heuristic, goal) -> {state: h}
     
     def get_initial_node(self):
 
@@ -25,6 +29,11 @@ class PathfindingProblem:
 
         return state == self.goal_state
     
+    def get_actions(self):
+        # Actions successors are generated from, fixed when the problem was built
+        # (later changes to the robot's motion model do not affect this problem).
+        return self._actions
+    
     def get_successors(self, node):
         """
         Get successor nodes from a given node.
@@ -36,10 +45,7 @@ class PathfindingProblem:
             List of successor Node objects
         """
         successors = []
-        neighbors = self.environment.get_neighbors(
-            node.state, 
-            self.robot.get_possible_actions()
-        )
+        neighbors = self.environment.get_neighbors(node.state, self._actions)
         
         for next_state, action, step_cost in neighbors:
             successor = Node(
@@ -62,8 +68,65 @@ class PathfindingProblem:
         # Args: state: Current state as tuple (x, y)
         if self.goal_state is None:
             return 0
-        return ((state[0] - self.goal_state[0])**2 + 
-                (state[1] - self.goal_state[1])**2)**0.5
+        return math.hypot(state[0] - self.goal_state[0], state[1] - self.goal_state[1])
+    
+    def heuristic_octile(self, state):
+        # Args: state: Current state as tuple (x, y)
+        # Exact distance on an open 8-connected grid, so tighter than euclidean
+        # while staying admissible; equals manhattan when there are no diagonals.
+        if self.goal_state is None:
+            return 0
+        dx = abs(state[0] - self.goal_state[0])
+        dy = abs(state[1] - self.goal_state[1])
+        straight, diagonal = self._octile_costs()
+        return straight * (dx + dy) + (diagonal - 2 * straight) * min(dx, dy)
+    
+    def _octile_costs(self):
+        # Cheapest straight and diagonal step in the robot's motion model.
+        # Without diagonal moves a diagonal step costs two straight ones.
+        actions = self._actions
+        straight = min((cost for dx, dy, cost in actions if (dx == 0) != (dy == 0)), default=1)
+        diagonal = min((cost for dx, dy, cost in actions if dx != 0 and dy != 0),
+                       default=2 * straight)
+        return straight, min(diagonal, 2 * straight)
+    
+    def get_heuristic_table(self, heuristic='euclidean'):
+        """
+        Get the heuristic value of every cell in the environment.
+        
+        Computed once per heuristic and goal with NumPy, so A* can look
+        values up instead of calling the heuristic for every successor.
+        
+        Args:
+            heuristic: 'manhattan', 'octile' or 'euclidean'
+            
+        Returns:
+            Dict mapping state (x, y) to its heuristic value
+        """
+        key = (heuristic, self.goal_state)
+        table = self._heuristic_tables.get(key)
+        if table is not None:
+            return table
+
+        width, height = self.environment.width, self.environment.height
+        xs, ys = np.meshgrid(np.arange(width), np.arange(height), indexing='ij')
+        if self.goal_state is None:
+            values = np.zeros((width, height), dtype=int)
+        else:
+            dx = np.abs(xs - self.goal_state[0])
+            dy = np.abs(ys - self.goal_state[1])
+            if heuristic == 'manhattan':
+                values = dx + dy
+            elif heuristic == 'octile':
+                straight, diagonal = self._octile_costs()
+                values = straight * (dx + dy) + (diagonal - 2 * straight) * np.minimum(dx, dy)
+            else:
+                values = np.sqrt(dx * dx + dy * dy)
+
+        states = zip(xs.ravel().tolist(), ys.ravel().tolist())
+        table = dict(zip(states, values.ravel().tolist()))
+        self._heuristic_tables[key] = table
+        return table
     
     def validate_problem(self):
         # Validate that the problem is properly configured.
@@ -1,26 +1,34 @@
 """
 SearchAlgorithms Class
-Implements all search algorithms: BFS, DFS, UCS, A* (tree and graph versions)
+Implements all search algorithms: BFS, DFS, UCS, A* (tree and graph versions),
+bidirectional BFS and iterative deepening A* (IDA*)
 """
 
 import time
+import itertools
 from collections import deque
 import heapq
 
+from node import Node
+
 
 class SearchAlgorithms:
 
-    def __init__(self, problem, max_depth=100, max_iterations=50000, timeout_seconds=30):
+    def __init__(self, problem, max_depth=100, max_iterations=50000, timeout_seconds=30,
+                 track_explored_order=True):
         self.problem = problem
         self.max_depth = max_depth
         self.max_iterations = max_iterations  # Maximum iterations before stopping
         self.timeout_seconds = timeout_seconds  # Maximum time before timeout
+        # Record the order graph searches expand states in (step-by-step view);
+        # when off, results carry explored_order=None
+        self.track_explored_order = track_explored_order
         self.results = {}  # Store results for comparison
     
     # ==================== BFS ALGORITHMS ====================
     
     def bfs_tree(self):
-        start_time = time.time()
+        start_time = time.monotonic()
 
         frontier = deque([self.problem.get_initial_node()])
         nodes_expanded = 0
@@ -28,28 +36,34 @@ class SearchAlgorithms:
         max_memory_usage = 1
         iterations = 0
 
+        # Bind attributes used every iteration to locals
+        is_goal = self.problem.is_goal
+        get_successors = self.problem.get_successors
+        max_depth = self.max_depth
+        max_iterations = self.max_iterations
+        timeout_seconds = self.timeout_seconds
+
         while frontier:
-            # Check timeout
-            if time.time() - start_time > self.timeout_seconds:
-                elapsed_time = time.time() - start_time
+            # Check timeout (sampled every 1024 iterations to keep clock reads off the hot path)
+            if iterations & 0x3FF == 0 and time.monotonic() - start_time > timeout_seconds:
                 raise TimeoutError(f"BFS-Tree exceeded timeout ({self.timeout_seconds}s). Tree algorithms may loop infinitely without visited state tracking. Consider using Graph version instead.")
 
             # Check iteration limit
             iterations += 1
-            if iterations > self.max_iterations:
-                elapsed_time = time.time() - start_time
+            if iterations > max_iterations:
                 raise RuntimeError(f"BFS-Tree exceeded maximum iterations ({self.max_iterations}). Tree algorithms may explore too many nodes without visited state tracking. Consider using Graph version instead.")
 
             current_size = len(frontier)
-            max_frontier_size = max(max_frontier_size, current_size)
-            max_memory_usage = max(max_memory_usage, current_size)
+            if current_size > max_frontier_size:
+                max_frontier_size = current_size
+                max_memory_usage = current_size  # Tree search holds only the frontier
 
             node = frontier.popleft()
             nodes_expanded += 1
 
             # Goal test
-            if self.problem.is_goal(node.state):
-                elapsed_time = time.time() - start_time
+            if is_goal(node.state):
+                elapsed_time = time.monotonic() - start_time
                 path = node.get_path()
 
                 result = {
@@ -68,13 +82,12 @@ class SearchAlgorithms:
                 return result
 
             # Depth limit check for tree search
-            if node.depth < self.max_depth:
+            if node.depth < max_depth:
                 # Expand node
-                for successor in self.problem.get_successors(node):
-                    frontier.append(successor)
+                frontier.extend(get_successors(node))
 
         # No solution found
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         result = {
             'node': None,
             'path': [],
@@ -91,58 +104,77 @@ class SearchAlgorithms:
         return result
     
     def bfs_graph(self):
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        frontier = deque([self.problem.get_initial_node()])
+        initial_node = self.problem.get_initial_node()
+        frontier = deque([initial_node])
         explored = set()
-        explored_order = []  # Track exploration order
+        explored_order = [] if self.track_explored_order else None  # Track exploration order
         nodes_expanded = 0
         max_frontier_size = 1
         max_memory_usage = 1
 
-        while frontier:
-            current_size = len(frontier)
-            max_frontier_size = max(max_frontier_size, current_size)
-            memory_usage = current_size + len(explored)
-            max_memory_usage = max(max_memory_usage, memory_usage)
+        # Goal test at generation time: with FIFO order the first goal generated
+        # is also the first one that would be popped, so only the start needs
+        # testing here and the last frontier level is never expanded
+        is_goal = self.problem.is_goal
+        goal_node = initial_node if is_goal(initial_node.state) else None
 
-            node = frontier.popleft()
+        # Bind attributes used every iteration to locals
+        get_successors = self.problem.get_successors
+        popleft = frontier.popleft
+        append = frontier.append
+        explored_add = explored.add
+        explored_order_append = explored_order.append if explored_order is not None else None
 
-            # Goal test
-            if self.problem.is_goal(node.state):
-                elapsed_time = time.time() - start_time
-                path = node.get_path()
+        while frontier and goal_node is None:
+            current_size = len(frontier)
+            if current_size > max_frontier_size:
+                max_frontier_size = current_size
+            memory_usage = current_size + len(explored)
+            if memory_usage > max_memory_usage:
+                max_memory_usage = memory_usage
 
-                result = {
-                    'node': node,
-                    'path': path,
-                    'cost': node.path_cost,
-                    'time': elapsed_time,
-                    'explored': explored,
-                    'explored_order': explored_order,  # Add ordered list
-                    'nodes_expanded': nodes_expanded,
-                    'path_length': len(path),
-                    'movement_time': len(path) * 0.5,
-                    'max_frontier_size': max_frontier_size,
-                    'max_memory_usage': max_memory_usage,
-                    'success': True
-                }
-                self.results['BFS-Graph'] = result
-                return result
+            node = popleft()
 
             # Mark as explored
             if node.state not in explored:
-                explored.add(node.state)
-                explored_order.append(node.state)  # Track order
+                explored_add(node.state)
+                if explored_order is not None:
+                    explored_order_append(node.state)  # Track order
                 nodes_expanded += 1
 
                 # Expand node
-                for successor in self.problem.get_successors(node):
+                for successor in get_successors(node):
                     if successor.state not in explored:
-                        frontier.append(successor)
+                        if is_goal(successor.state):
+                            goal_node = successor
+                            break
+                        append(successor)
+
+        elapsed_time = time.monotonic() - start_time
+
+        if goal_node is not None:
+            path = goal_node.get_path()
+
+            result = {
+                'node': goal_node,
+                'path': path,
+                'cost': goal_node.path_cost,
+                'time': elapsed_time,
+                'explored': explored,
+                'explored_order': explored_order,  # Add ordered list
+                'nodes_expanded': nodes_expanded,
+                'path_length': len(path),
+                'movement_time': len(path) * 0.5,
+                'max_frontier_size': max_frontier_size,
+                'max_memory_usage': max_memory_usage,
+                'success': True
+            }
+            self.results['BFS-Graph'] = result
+            return result
 
         # No solution found
-        elapsed_time = time.time() - start_time
         result = {
             'node': None,
             'path': [],
@@ -160,10 +192,135 @@ class SearchAlgorithms:
         self.results['BFS-Graph'] = result
         return result
     
+    def bfs_graph_bidirectional(self):
+        # Breadth-first search from the start and the goal at once, one full
+        # level of the smaller side at a time, until the two sides meet.
+        # Each side only reaches about half the solution depth, so far fewer
+        # states are expanded than by bfs_graph on long paths.
+        # Grid moves are reversible, so the backward side expands with the
+        # same successor function; the motion model must contain the reverse
+        # of every action at the same cost (true for the 4 and 8 direction models).
+        start_time = time.monotonic()
+
+        # Check the actions get_successors actually expands with, not the robot's current model
+        moves = {(dx, dy): cost for dx, dy, cost in self.problem.get_actions()}
+        if any(moves.get((-dx, -dy)) != cost for (dx, dy), cost in moves.items()):
+            raise ValueError("Bidirectional BFS needs a motion model with the reverse of every action at the same cost")
+
+        get_successors = self.problem.get_successors
+        initial_node = self.problem.get_initial_node()
+        goal_root = Node(state=self.problem.goal_state)
+
+        # Per side: frontier of the current level and state -> Node for every state reached
+        forward_frontier = deque([initial_node])
+        backward_frontier = deque([goal_root])
+        forward_reached = {initial_node.state: initial_node}
+        backward_reached = {goal_root.state: goal_root}
+        explored = set()
+        explored_order = [] if self.track_explored_order else None  # Track exploration order
+        nodes_expanded = 0
+        max_frontier_size = 2
+        max_memory_usage = 2
+
+        meeting = None
+        if initial_node.state in backward_reached:
+            meeting = (initial_node, goal_root)
+
+        # Bind attributes used every iteration to locals
+        explored_add = explored.add
+        explored_order_append = explored_order.append if explored_order is not None else None
+
+        while meeting is None and forward_frontier and backward_frontier:
+            current_size = len(forward_frontier) + len(backward_frontier)
+            if current_size > max_frontier_size:
+                max_frontier_size = current_size
+            memory_usage = current_size + len(explored)
+            if memory_usage > max_memory_usage:
+                max_memory_usage = memory_usage
+
+            # Expand the smaller side by one whole level
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, reached, other_reached, forward = forward_frontier, forward_reached, backward_reached, True
+            else:
+                frontier, reached, other_reached, forward = backward_frontier, backward_reached, forward_reached, False
+            popleft, append = frontier.popleft, frontier.append
+
+            # Finish the level before stopping and keep the shortest meeting,
+            # a later node in the level can meet the other side one level closer
+            best_depth = None
+            for _ in range(len(frontier)):
+                node = popleft()
+                if node.state not in explored:
+                    explored_add(node.state)
+                    if explored_order is not None:
+                        explored_order_append(node.state)  # Track order
+                nodes_expanded += 1
+
+                for successor in get_successors(node):
+                    state = successor.state
+                    if state in reached:
+                        continue
+                    reached[state] = successor
+                    other = other_reached.get(state)
+                    if other is not None:
+                        depth = successor.depth + other.depth
+                        if best_depth is None or depth < best_depth:
+                            best_depth = depth
+                            meeting = (successor, other) if forward else (other, successor)
+                    append(successor)
+
+        elapsed_time = time.monotonic() - start_time
+
+        if meeting is not None:
+            # Continue the forward chain back along the backward chain to the goal,
+            # reversing each backward action
+            node, backward_node = meeting
+            while backward_node.parent is not None:
+                dx, dy, cost = backward_node.action
+                backward_node = backward_node.parent
+                node = Node(state=backward_node.state, parent=node,
+                            action=(-dx, -dy, cost), path_cost=node.path_cost + cost)
+            path = node.get_path()
+
+            result = {
+                'node': node,
+                'path': path,
+                'cost': node.path_cost,
+                'time': elapsed_time,
+                'explored': explored,
+                'explored_order': explored_order,  # Add ordered list
+                'nodes_expanded': nodes_expanded,
+                'path_length': len(path),
+                'movement_time': len(path) * 0.5,
+                'max_frontier_size': max_frontier_size,
+                'max_memory_usage': max_memory_usage,
+                'success': True
+            }
+            self.results['BFS-Bidirectional'] = result
+            return result
+
+        # No solution found
+        result = {
+            'node': None,
+            'path': [],
+            'cost': float('inf'),
+            'time': elapsed_time,
+            'explored': explored,
+            'explored_order': explored_order,  # Add ordered list
+            'nodes_expanded': nodes_expanded,
+            'path_length': 0,
+            'movement_time': 0,
+            'max_frontier_size': max_frontier_size,
+            'max_memory_usage': max_memory_usage,
+            'success': False
+        }
+        self.results['BFS-Bidirectional'] = result
+        return result
+    
     # ==================== DFS ALGORITHMS ====================
     
     def dfs_tree(self):
-        start_time = time.time()
+        start_time = time.monotonic()
 
         frontier = [self.problem.get_initial_node()]  # Use list as stack
         nodes_expanded = 0
@@ -171,28 +328,34 @@ class SearchAlgorithms:
         max_memory_usage = 1
         iterations = 0
 
+        # Bind attributes used every iteration to locals
+        is_goal = self.problem.is_goal
+        get_successors = self.problem.get_successors
+        max_depth = self.max_depth
+        max_iterations = self.max_iterations
+        timeout_seconds = self.timeout_seconds
+
         while frontier:
-            # Check timeout
-            if time.time() - start_time > self.timeout_seconds:
-                elapsed_time = time.time() - start_time
+            # Check timeout (sampled every 1024 iterations to keep clock reads off the hot path)
+            if iterations & 0x3FF == 0 and time.monotonic() - start_time > timeout_seconds:
                 raise TimeoutError(f"DFS-Tree exceeded timeout ({self.timeout_seconds}s). Tree algorithms may loop infinitely without visited state tracking. Consider using Graph version instead.")
 
             # Check iteration limit
             iterations += 1
-            if iterations > self.max_iterations:
-                elapsed_time = time.time() - start_time
+            if iterations > max_iterations:
                 raise RuntimeError(f"DFS-Tree exceeded maximum iterations ({self.max_iterations}). Tree algorithms may explore too many nodes without visited state tracking. Consider using Graph version instead.")
 
             current_size = len(frontier)
-            max_frontier_size = max(max_frontier_size, current_size)
-            max_memory_usage = max(max_memory_usage, current_size)
+            if current_size > max_frontier_size:
+                max_frontier_size = current_size
+                max_memory_usage = current_size  # Tree search holds only the frontier
 
             node = frontier.pop()  # LIFO - pop from end
             nodes_expanded += 1
 
             # Goal test
-            if self.problem.is_goal(node.state):
-                elapsed_time = time.time() - start_time
+            if is_goal(node.state):
+                elapsed_time = time.monotonic() - start_time
                 path = node.get_path()
 
                 result = {
@@ -211,14 +374,12 @@ class SearchAlgorithms:
                 return result
 
             # Depth limit check for tree search
-            if node.depth < self.max_depth:
+            if node.depth < max_depth:
                 # Expand node (add in reverse to maintain left-to-right order)
-                successors = self.problem.get_successors(node)
-                for successor in reversed(successors):
-                    frontier.append(successor)
+                frontier.extend(get_successors(node)[::-1])
 
         # No solution found
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         result = {
             'node': None,
             'path': [],
@@ -235,26 +396,36 @@ class SearchAlgorithms:
         return result
     
     def dfs_graph(self):
-        start_time = time.time()
+        start_time = time.monotonic()
 
         frontier = [self.problem.get_initial_node()]
         explored = set()
-        explored_order = []  # Track exploration order
+        explored_order = [] if self.track_explored_order else None  # Track exploration order
         nodes_expanded = 0
         max_frontier_size = 1
         max_memory_usage = 1
 
+        # Bind attributes used every iteration to locals
+        is_goal = self.problem.is_goal
+        get_successors = self.problem.get_successors
+        pop = frontier.pop
+        extend = frontier.extend
+        explored_add = explored.add
+        explored_order_append = explored_order.append if explored_order is not None else None
+
         while frontier:
             current_size = len(frontier)
-            max_frontier_size = max(max_frontier_size, current_size)
+            if current_size > max_frontier_size:
+                max_frontier_size = current_size
             memory_usage = current_size + len(explored)
-            max_memory_usage = max(max_memory_usage, memory_usage)
+            if memory_usage > max_memory_usage:
+                max_memory_usage = memory_usage
 
-            node = frontier.pop()
+            node = pop()
 
             # Goal test
-            if self.problem.is_goal(node.state):
-                elapsed_time = time.time() - start_time
+            if is_goal(node.state):
+                elapsed_time = time.monotonic() - start_time
                 path = node.get_path()
 
                 result = {
@@ -276,18 +447,18 @@ class SearchAlgorithms:
 
             # Mark as explored
             if node.state not in explored:
-                explored.add(node.state)
-                explored_order.append(node.state)  # Track order
+                explored_add(node.state)
+                if explored_order is not None:
+                    explored_order_append(node.state)  # Track order
                 nodes_expanded += 1
 
                 # Expand node
-                successors = self.problem.get_successors(node)
-                for successor in reversed(successors):
-                    if successor.state not in explored:
-                        frontier.append(successor)
+                successors = get_successors(node)
+                extend([successor for successor in successors[::-1]
+                        if successor.state not in explored])
 
         # No solution found
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         result = {
             'node': None,
             'path': [],
@@ -308,38 +479,45 @@ class SearchAlgorithms:
     # ==================== UCS ALGORITHMS ====================
     
     def ucs_tree(self):
-        start_time = time.time()
+        start_time = time.monotonic()
 
         initial_node = self.problem.get_initial_node()
-        frontier = [(initial_node.path_cost, id(initial_node), initial_node)]
+        push_order = itertools.count(0, -1)  # Tiebreaker for equal priorities, last pushed pops first
+        frontier = [(initial_node.path_cost, next(push_order), initial_node)]
         heapq.heapify(frontier)
         nodes_expanded = 0
         max_frontier_size = 1
         max_memory_usage = 1
         iterations = 0
 
+        # Bind attributes used every iteration to locals
+        is_goal = self.problem.is_goal
+        get_successors = self.problem.get_successors
+        max_depth = self.max_depth
+        max_iterations = self.max_iterations
+        timeout_seconds = self.timeout_seconds
+
         while frontier:
-            # Check timeout
-            if time.time() - start_time > self.timeout_seconds:
-                elapsed_time = time.time() - start_time
+            # Check timeout (sampled every 1024 iterations to keep clock reads off the hot path)
+            if iterations & 0x3FF == 0 and time.monotonic() - start_time > timeout_seconds:
                 raise TimeoutError(f"UCS-Tree exceeded timeout ({self.timeout_seconds}s). Tree algorithms may loop infinitely without visited state tracking. Consider using Graph version instead.")
 
             # Check iteration limit
             iterations += 1
-            if iterations > self.max_iterations:
-                elapsed_time = time.time() - start_time
+            if iterations > max_iterations:
                 raise RuntimeError(f"UCS-Tree exceeded maximum iterations ({self.max_iterations}). Tree algorithms may explore too many nodes without visited state tracking. Consider using Graph version instead.")
 
             current_size = len(frontier)
-            max_frontier_size = max(max_frontier_size, current_size)
-            max_memory_usage = max(max_memory_usage, current_size)
+            if current_size > max_frontier_size:
+                max_frontier_size = current_size
+                max_memory_usage = current_size  # Tree search holds only the frontier
 
             _, _, node = heapq.heappop(frontier)
             nodes_expanded += 1
 
             # Goal test
-            if self.problem.is_goal(node.state):
-                elapsed_time = time.time() - start_time
+            if is_goal(node.state):
+                elapsed_time = time.monotonic() - start_time
                 path = node.get_path()
 
                 result = {
@@ -358,13 +536,13 @@ class SearchAlgorithms:
                 return result
 
             # Depth limit check for tree search
-            if node.depth < self.max_depth:
+            if node.depth < max_depth:
                 # Expand node
-                for successor in self.problem.get_successors(node):
-                    heapq.heappush(frontier, (successor.path_cost, id(successor), successor))
+                for successor in get_successors(node):
+                    heapq.heappush(frontier, (successor.path_cost, next(push_order), successor))
 
         # No solution found
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         result = {
             'node': None,
             'path': [],
@@ -381,28 +559,52 @@ class SearchAlgorithms:
         return result
     
     def ucs_graph(self):
-        start_time = time.time()
+        start_time = time.monotonic()
 
         initial_node = self.problem.get_initial_node()
-        frontier = [(initial_node.path_cost, id(initial_node), initial_node)]
+        push_order = itertools.count(0, -1)  # Tiebreaker for equal priorities, last pushed pops first
+        frontier = [(initial_node.path_cost, next(push_order), initial_node)]
         heapq.heapify(frontier)
         explored = set()
-        explored_order = []  # Track exploration order
+        explored_order = [] if self.track_explored_order else None  # Track exploration order
+        best_g = {initial_node.state: initial_node.path_cost}  # Cheapest cost pushed per state
         nodes_expanded = 0
         max_frontier_size = 1
         max_memory_usage = 1
-
-        while frontier:
-            current_size = len(frontier)
-            max_frontier_size = max(max_frontier_size, current_size)
+        pending = None  # Last entry pushed by an expansion, merged into the next pop
+
+        # Bind attributes used every iteration to locals
+        is_goal = self.problem.is_goal
+        get_successors = self.problem.get_successors
+        heappush, heappop, heappushpop = heapq.heappush, heapq.heappop, heapq.heappushpop
+        explored_add = explored.add
+        explored_order_append = explored_order.append if explored_order is not None else None
+        inf = float('inf')
+
+        while frontier or pending is not None:
+            current_size = len(frontier) + (pending is not None)
+            if current_size > max_frontier_size:
+                max_frontier_size = current_size
             memory_usage = current_size + len(explored)
-            max_memory_usage = max(max_memory_usage, memory_usage)
-
-            _, _, node = heapq.heappop(frontier)
+            if memory_usage > max_memory_usage:
+                max_memory_usage = memory_usage
+
+            # heappushpop returns at once when the pending entry is the smallest,
+            # cheaper than pushing it and then popping
+            if pending is None:
+                _, _, node = heappop(frontier)
+            else:
+                _, _, node = heappushpop(frontier, pending)
+                pending = None
+
+            # Lazy deletion: an entry whose cost is above the best pushed for its
+            # state was superseded after it was queued, skip it untouched
+            if node.path_cost > best_g[node.state]:
+                continue
 
             # Goal test
-            if self.problem.is_goal(node.state):
-                elapsed_time = time.time() - start_time
+            if is_goal(node.state):
+                elapsed_time = time.monotonic() - start_time
                 path = node.get_path()
 
                 result = {
@@ -422,19 +624,28 @@ class SearchAlgorithms:
                 self.results['UCS-Graph'] = result
                 return result
 
-            # Mark as explored
-            if node.state not in explored:
-                explored.add(node.state)
-                explored_order.append(node.state)  # Track order
-                nodes_expanded += 1
+            # Mark as explored (the guard above lets through one entry per state)
+            explored_add(node.state)
+            if explored_order is not None:
+                explored_order_append(node.state)  # Track order
+            nodes_expanded += 1
 
-                # Expand node
-                for successor in self.problem.get_successors(node):
-                    if successor.state not in explored:
-                        heapq.heappush(frontier, (successor.path_cost, id(successor), successor))
+            # Expand node
+            for successor in get_successors(node):
+                state = successor.state
+                if state in explored:
+                    continue
+                # Only push when this path beats every one already queued for the state,
+                # otherwise the heap fills with entries that can never be expanded
+                g = successor.path_cost
+                if g < best_g.get(state, inf):
+                    best_g[state] = g
+                    if pending is not None:
+                        heappush(frontier, pending)
+                    pending = (g, next(push_order), successor)
 
         # No solution found
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         result = {
             'node': None,
             'path': [],
@@ -455,45 +666,49 @@ class SearchAlgorithms:
     # ==================== A* ALGORITHMS ====================
     
     def astar_tree(self, heuristic='euclidean'):
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        # Select heuristic function
-        if heuristic == 'manhattan':
-            h_func = self.problem.heuristic_manhattan
-        else:
-            h_func = self.problem.heuristic_euclidean
+        # Heuristic value of every cell, computed once per problem
+        h_table = self.problem.get_heuristic_table(heuristic)
 
         initial_node = self.problem.get_initial_node()
-        f_initial = initial_node.path_cost + h_func(initial_node.state)
-        frontier = [(f_initial, id(initial_node), initial_node)]
+        f_initial = initial_node.path_cost + h_table[initial_node.state]
+        push_order = itertools.count(0, -1)  # Tiebreaker for equal priorities, last pushed pops first
+        frontier = [(f_initial, next(push_order), initial_node)]
         heapq.heapify(frontier)
         nodes_expanded = 0
         max_frontier_size = 1
         max_memory_usage = 1
         iterations = 0
 
+        # Bind attributes used every iteration to locals
+        is_goal = self.problem.is_goal
+        get_successors = self.problem.get_successors
+        max_depth = self.max_depth
+        max_iterations = self.max_iterations
+        timeout_seconds = self.timeout_seconds
+
         while frontier:
-            # Check timeout
-            if time.time() - start_time > self.timeout_seconds:
-                elapsed_time = time.time() - start_time
+            # Check timeout (sampled every 1024 iterations to keep clock reads off the hot path)
+            if iterations & 0x3FF == 0 and time.monotonic() - start_time > timeout_seconds:
                 raise TimeoutError(f"A*-Tree exceeded timeout ({self.timeout_seconds}s). Tree algorithms may loop infinitely without visited state tracking. Consider using Graph version instead.")
 
             # Check iteration limit
             iterations += 1
-            if iterations > self.max_iterations:
-                elapsed_time = time.time() - start_time
+            if iterations > max_iterations:
                 raise RuntimeError(f"A*-Tree exceeded maximum iterations ({self.max_iterations}). Tree algorithms may explore too many nodes without visited state tracking. Consider using Graph version instead.")
 
             current_size = len(frontier)
-            max_frontier_size = max(max_frontier_size, current_size)
-            max_memory_usage = max(max_memory_usage, current_size)
+            if current_size > max_frontier_size:
+                max_frontier_size = current_size
+                max_memory_usage = current_size  # Tree search holds only the frontier
 
             _, _, node = heapq.heappop(frontier)
             nodes_expanded += 1
 
             # Goal test
-            if self.problem.is_goal(node.state):
-                elapsed_time = time.time() - start_time
+            if is_goal(node.state):
+                elapsed_time = time.monotonic() - start_time
                 path = node.get_path()
 
                 result = {
@@ -513,14 +728,14 @@ class SearchAlgorithms:
                 return result
 
             # Depth limit check for tree search
-            if node.depth < self.max_depth:
+            if node.depth < max_depth:
                 # Expand node
-                for successor in self.problem.get_successors(node):
-                    f_value = successor.path_cost + h_func(successor.state)
-                    heapq.heappush(frontier, (f_value, id(successor), successor))
+                for successor in get_successors(node):
+                    f_value = successor.path_cost + h_table[successor.state]
+                    heapq.heappush(frontier, (f_value, next(push_order), successor))
 
         # No solution found
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         result = {
             'node': None,
             'path': [],
@@ -538,35 +753,56 @@ class SearchAlgorithms:
         return result
     
     def astar_graph(self, heuristic='euclidean'):
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        # Select heuristic function
-        if heuristic == 'manhattan':
-            h_func = self.problem.heuristic_manhattan
-        else:
-            h_func = self.problem.heuristic_euclidean
+        # Heuristic value of every cell, computed once per problem
+        h_table = self.problem.get_heuristic_table(heuristic)
 
         initial_node = self.problem.get_initial_node()
-        f_initial = initial_node.path_cost + h_func(initial_node.state)
-        frontier = [(f_initial, id(initial_node), initial_node)]
+        f_initial = initial_node.path_cost + h_table[initial_node.state]
+        push_order = itertools.count(0, -1)  # Tiebreaker for equal priorities, last pushed pops first
+        frontier = [(f_initial, next(push_order), initial_node)]
         heapq.heapify(frontier)
         explored = set()
-        explored_order = []  # Track exploration order
+        explored_order = [] if self.track_explored_order else None  # Track exploration order
+        best_g = {initial_node.state: initial_node.path_cost}  # Cheapest cost pushed per state
         nodes_expanded = 0
         max_frontier_size = 1
         max_memory_usage = 1
-
-        while frontier:
-            current_size = len(frontier)
-            max_frontier_size = max(max_frontier_size, current_size)
+        pending = None  # Last entry pushed by an expansion, merged into the next pop
+
+        # Bind attributes used every iteration to locals
+        is_goal = self.problem.is_goal
+        get_successors = self.problem.get_successors
+        heappush, heappop, heappushpop = heapq.heappush, heapq.heappop, heapq.heappushpop
+        explored_add = explored.add
+        explored_order_append = explored_order.append if explored_order is not None else None
+        inf = float('inf')
+
+        while frontier or pending is not None:
+            current_size = len(frontier) + (pending is not None)
+            if current_size > max_frontier_size:
+                max_frontier_size = current_size
             memory_usage = current_size + len(explored)
-            max_memory_usage = max(max_memory_usage, memory_usage)
-
-            _, _, node = heapq.heappop(frontier)
+            if memory_usage > max_memory_usage:
+                max_memory_usage = memory_usage
+
+            # heappushpop returns at once when the pending entry is the smallest,
+            # cheaper than pushing it and then popping
+            if pending is None:
+                _, _, node = heappop(frontier)
+            else:
+                _, _, node = heappushpop(frontier, pending)
+                pending = None
+
+            # Lazy deletion: an entry whose cost is above the best pushed for its
+            # state was superseded after it was queued, skip it untouched
+            if node.path_cost > best_g[node.state]:
+                continue
 
             # Goal test
-            if self.problem.is_goal(node.state):
-                elapsed_time = time.time() - start_time
+            if is_goal(node.state):
+                elapsed_time = time.monotonic() - start_time
                 path = node.get_path()
 
                 result = {
@@ -587,20 +823,29 @@ class SearchAlgorithms:
                 self.results['A*-Graph'] = result
                 return result
 
-            # Mark as explored
-            if node.state not in explored:
-                explored.add(node.state)
-                explored_order.append(node.state)  # Track order
-                nodes_expanded += 1
+            # Mark as explored (the guard above lets through one entry per state)
+            explored_add(node.state)
+            if explored_order is not None:
+                explored_order_append(node.state)  # Track order
+            nodes_expanded += 1
 
-                # Expand node
-                for successor in self.problem.get_successors(node):
-                    if successor.state not in explored:
-                        f_value = successor.path_cost + h_func(successor.state)
-                        heapq.heappush(frontier, (f_value, id(successor), successor))
+            # Expand node
+            for successor in get_successors(node):
+                state = successor.state
+                if state in explored:
+                    continue
+                # Only push when this path beats every one already queued for the state,
+                # otherwise the heap fills with entries that can never be expanded
+                g = successor.path_cost
+                if g < best_g.get(state, inf):
+                    best_g[state] = g
+                    f_value = g + h_table[state]
+                    if pending is not None:
+                        heappush(frontier, pending)
+                    pending = (f_value, next(push_order), successor)
 
         # No solution found
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         result = {
             'node': None,
             'path': [],
@@ -617,4 +862,159 @@ class SearchAlgorithms:
             'success': False
         }
         self.results['A*-Graph'] = result
-        return result
\ No newline at end of file
+        return result
+    
+    def astar_ida(self, heuristic='euclidean'):
+        # Iterative deepening A*: depth-first search cut off at an f-cost bound,
+        # repeated with a higher bound until the goal is found or nothing is left
+        # beyond the bound. No heap; besides the current path it only keeps the
+        # cheapest g seen per state.
+        # Uses an explicit stack of successor iterators instead of recursion
+        # so long paths do not hit Python's recursion limit. max_depth is not
+        # applied: the bound and the g tables already make every pass finite, and
+        # a depth cut would turn solvable mazes with long paths into "no path".
+        start_time = time.monotonic()
+
+        # Heuristic value of every cell, computed once per problem
+        h_table = self.problem.get_heuristic_table(heuristic)
+
+        initial_node = self.problem.get_initial_node()
+        explored = set()  # States expanded in any pass
+        explored_order = [] if self.track_explored_order else None  # Track exploration order (first expansion)
+        nodes_expanded = 0
+        max_frontier_size = 1
+        max_memory_usage = 1
+        iterations = 0
+
+        # Bind attributes used every iteration to locals
+        is_goal = self.problem.is_goal
+        get_successors = self.problem.get_successors
+        max_iterations = self.max_iterations
+        timeout_seconds = self.timeout_seconds
+        inf = float('inf')
+
+        goal_node = initial_node if is_goal(initial_node.state) else None
+        bound = initial_node.path_cost + h_table[initial_node.state]
+        # Lowest g any path has reached each state with, kept across passes. A path
+        # reaching a state at a strictly higher g cannot be optimal, so it is pruned
+        # instead of being searched again on every later pass
+        g_min = {initial_node.state: initial_node.path_cost}
+
+        while goal_node is None:
+            # Each pass is a fresh bounded DFS, so the iteration limit applies per pass
+            pass_iterations = 0
+            pass_expanded = 1
+            cutoffs = []  # (state, g, f) of successors pruned by the bound
+            # Cheapest g reaching each state in this pass. Grids have huge numbers of
+            # equal-cost paths to the same cell, so re-entering a state at no better
+            # cost is pruned (this also cuts cycles); it is reset on every pass
+            best_g = {initial_node.state: initial_node.path_cost}
+            stack = [iter(get_successors(initial_node))]  # Successors left to try per path node
+            nodes_expanded += 1
+            if initial_node.state not in explored:
+                explored.add(initial_node.state)
+                if explored_order is not None:
+                    explored_order.append(initial_node.state)  # Track order
+
+            while stack:
+                # Check timeout (sampled every 1024 iterations to keep clock reads off the hot path)
+                if iterations & 0x3FF == 0 and time.monotonic() - start_time > timeout_seconds:
+                    raise TimeoutError(f"A*-IDA exceeded timeout ({self.timeout_seconds}s). Each pass repeats the search from the start. Consider using A*-Graph instead.")
+
+                # Check iteration limit
+                iterations += 1
+                pass_iterations += 1
+                if pass_iterations > max_iterations:
+                    raise RuntimeError(f"A*-IDA exceeded maximum iterations ({self.max_iterations}) in a single pass. Consider using A*-Graph instead.")
+
+                for successor in stack[-1]:
+                    state = successor.state
+                    g = successor.path_cost
+                    if best_g.get(state, inf) <= g or g > g_min.get(state, inf):
+                        continue
+                    g_min[state] = g
+                    f_value = g + h_table[state]
+                    if f_value > bound:
+                        cutoffs.append((state, g, f_value))
+                        continue
+                    if is_goal(state):
+                        # The bound may be above the optimal cost, so keep the goal and
+                        # finish the pass only looking for a cheaper one
+                        if goal_node is None or g < goal_node.path_cost:
+                            goal_node = successor
+                            bound = g
+                        continue
+                    best_g[state] = g
+                    stack.append(iter(get_successors(successor)))
+                    nodes_expanded += 1
+                    pass_expanded += 1
+                    if state not in explored:
+                        explored.add(state)
+                        if explored_order is not None:
+                            explored_order.append(state)  # Track order
+                    if len(stack) > max_frontier_size:
+                        max_frontier_size = len(stack)
+                    memory_usage = len(stack) + len(g_min)
+                    if memory_usage > max_memory_usage:
+                        max_memory_usage = memory_usage
+                    break
+                else:
+                    # All successors tried, backtrack
+                    stack.pop()
+
+            if goal_node is not None:
+                break
+
+            # Cut-offs at states expanded or reached more cheaply later in the pass
+            # are covered by that cheaper path, so they cannot extend the search
+            open_f = sorted(f for state, g, f in cutoffs
+                            if g < best_g.get(state, inf) and g <= g_min[state])
+            if not open_f:
+                break  # Everything reachable has been searched (there is no depth cut), no path
+
+            # Raise the bound far enough to admit about as many new nodes as this
+            # pass expanded, so the work per pass grows geometrically instead of
+            # one pass per distinct f value (irrational with diagonal or euclidean costs)
+            bound = open_f[min(len(open_f), pass_expanded) - 1]
+
+        elapsed_time = time.monotonic() - start_time
+
+        if goal_node is not None:
+            path = goal_node.get_path()
+
+            result = {
+                'node': goal_node,
+                'path': path,
+                'cost': goal_node.path_cost,
+                'time': elapsed_time,
+                'explored': explored,
+                'explored_order': explored_order,  # Add ordered list
+                'nodes_expanded': nodes_expanded,
+                'path_length': len(path),
+                'movement_time': len(path) * 0.5,
+                'max_frontier_size': max_frontier_size,
+                'max_memory_usage': max_memory_usage,
+                'heuristic': heuristic,
+                'success': True
+            }
+            self.results['A*-IDA'] = result
+            return result
+
+        # No solution found
+        result = {
+            'node': None,
+            'path': [],
+            'cost': float('inf'),
+            'time': elapsed_time,
+            'explored': explored,
+            'explored_order': explored_order,  # Add ordered list
+            'nodes_expanded': nodes_expanded,
+            'path_length': 0,
+            'movement_time': 0,
+            'max_frontier_size': max_frontier_size,
+            'max_memory_usage': max_memory_usage,
+            'heuristic': heuristic,
+            'success': False
+        }
+        self.results['A*-IDA'] = result
+        return result
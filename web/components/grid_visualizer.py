@@ -1,5 +1,6 @@
 """Grid visualization components for displaying pathfinding results"""
 
+import numpy as np
 import streamlit as st
 import time
 
@@ -43,12 +44,10 @@ def create_html_grid(env, path=None, explored=None, current_pos=None,
                 html_content += f'<rect x="{x_pos}" y="{y_pos}" width="{cell_size}" height="{cell_size}" fill="#3498db" opacity="0.3"/>\n'
     
     # Draw obstacles
-    for y in range(env.height):
-        for x in range(env.width):
-            if env.grid[y, x] == 1:
-                x_pos = x * cell_size
-                y_pos = y * cell_size
-                html_content += f'<rect x="{x_pos}" y="{y_pos}" width="{cell_size}" height="{cell_size}" fill="#2c3e50"/>\n'
+    for y, x in np.argwhere(env.grid == 1).tolist():
+        x_pos = x * cell_size
+        y_pos = y * cell_size
+        html_content += f'<rect x="{x_pos}" y="{y_pos}" width="{cell_size}" height="{cell_size}" fill="#2c3e50"/>\n'
     
     # Draw path
     if path and show_path and len(path) > 1:
@@ -155,7 +154,7 @@ def show_step_by_step():
     env = st.session_state.env
 
     # Use exploration order if available, otherwise fall back to unordered set
-    if 'explored_order' in result:
+    if result.get('explored_order') is not None:
         explored_list = result['explored_order']
         st.write("*Showing nodes in the order they were actually explored by the algorithm.*")
     elif 'explored' in result:
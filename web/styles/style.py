@@ -3,9 +3,7 @@
 import streamlit as st
 
 
-def apply_custom_styling():
-    """Apply custom CSS styling to the Streamlit app"""
-    st.markdown("""
+CUSTOM_CSS = """
         <style>
         /* Make sidebar text bigger */
         [data-testid="stSidebar"] {
@@ -50,4 +48,9 @@ def apply_custom_styling():
             color: #34495e;
         }
         </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def apply_custom_styling():
+    """Apply custom CSS styling to the Streamlit app"""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
@@ -1,8 +1,8 @@
 """UI screen components for setup and visualization"""
-import random
+import numpy as np
 import streamlit as st
 from environment import Environment
-from robot import Robot
+from robot import Robot, SQRT2
 from problem import PathfindingProblem
 from search_algorithms import SearchAlgorithms
 from web.components.grid_visualizer import (
@@ -10,6 +10,89 @@ from web.components.grid_visualizer import (
 )
 
 
+# Algorithm name -> runner taking (search, heuristic); heuristic is only used by A*
+ALGORITHMS = {
+    'BFS-Graph': lambda search, heuristic: search.bfs_graph(),
+    'BFS-Bidirectional': lambda search, heuristic: search.bfs_graph_bidirectional(),
+    'DFS-Graph': lambda search, heuristic: search.dfs_graph(),
+    'UCS-Graph': lambda search, heuristic: search.ucs_graph(),
+    'A*-Graph': lambda search, heuristic: search.astar_graph(heuristic=heuristic),
+    'A*-IDA': lambda search, heuristic: search.astar_ida(heuristic=heuristic),
+    'BFS-Tree': lambda search, heuristic: search.bfs_tree(),
+    'DFS-Tree': lambda search, heuristic: search.dfs_tree(),
+    'UCS-Tree': lambda search, heuristic: search.ucs_tree(),
+    'A*-Tree': lambda search, heuristic: search.astar_tree(heuristic=heuristic),
+}
+
+
+def build_preset_environment(env_type):
+    """Build one of the preset environments.
+
+    Not cached: building a preset takes microseconds, less than hashing the
+    argument and unpickling a cached copy, and each call returns a new
+    Environment the caller is free to modify.
+    """
+    if env_type == "Simple 10x10":
+        env = Environment(width=10, height=10, has_border=True)
+        env.add_obstacle_rectangle(3, 3, 2, 4)
+        env.add_obstacle(6, 5)
+        env.add_obstacle(6, 6)
+        env.set_initial_state(2, 2)
+        env.set_goal_state(7, 7)
+    
+    elif env_type == "Medium 12x12":
+        env = Environment(width=12, height=12, has_border=True)
+        env.add_obstacle_rectangle(4, 4, 4, 1)
+        env.add_obstacle_rectangle(4, 7, 4, 1)
+        env.set_initial_state(2, 2)
+        env.set_goal_state(9, 9)
+    
+    elif env_type == "Complex 15x15":
+        env = Environment(width=15, height=15, has_border=True)
+
+        # 25% wall coverage with irregular maze - asymmetric gaps
+        # Creates winding paths forcing BFS/UCS to explore extensively
+
+        # --- Vertical barriers with staggered gaps ---
+        env.add_obstacle_rectangle(3, 2, 1, 4)    # x=3, y=2-5 (gap at y=1,6-13)
+        env.add_obstacle_rectangle(3, 8, 1, 4)    # x=3, y=8-11 (gap at y=7,12-13)
+
+        env.add_obstacle_rectangle(6, 1, 1, 3)    # x=6, y=1-3 (gap at y=4-13)
+        env.add_obstacle_rectangle(6, 9, 1, 4)    # x=6, y=9-12 (gap at y=4-8,13)
+
+        env.add_obstacle_rectangle(9, 3, 1, 4)    # x=9, y=3-6 (gap at y=1-2,7-13)
+        env.add_obstacle_rectangle(9, 10, 1, 3)   # x=9, y=10-12 (gap at y=7-9)
+
+        env.add_obstacle_rectangle(12, 2, 1, 5)   # x=12, y=2-6 (gap at y=1,7-13)
+        env.add_obstacle_rectangle(12, 9, 1, 2)   # x=12, y=9-10 (gap at y=7-8,11-13)
+
+        # --- Horizontal barriers with offset gaps ---
+        env.add_obstacle_rectangle(1, 5, 2, 1)    # y=5, x=1-2 (gap at x=3-13)
+        env.add_obstacle_rectangle(4, 5, 2, 1)    # y=5, x=4-5 (creates zigzag)
+
+        env.add_obstacle_rectangle(7, 7, 2, 1)    # y=7, x=7-8
+        env.add_obstacle_rectangle(10, 7, 2, 1)   # y=7, x=10-11
+
+        env.add_obstacle_rectangle(2, 11, 2, 1)   # y=11, x=2-3
+        env.add_obstacle_rectangle(5, 11, 2, 1)   # y=11, x=5-6
+        env.add_obstacle_rectangle(8, 11, 1, 1)   # y=11, x=8
+
+        # --- Strategic scattered obstacles ---
+        env.add_obstacle(4, 3)
+        env.add_obstacle(7, 4)
+        env.add_obstacle(11, 8)
+        env.add_obstacle(5, 9)
+
+        # Start & Goal
+        env.set_initial_state(1, 1)
+        env.set_goal_state(12, 12)
+
+    else:
+        raise ValueError(f"Unknown preset environment: {env_type}")
+
+    return env
+
+
 def setup_screen():
     """First screen: Setup environment and algorithm"""
 
@@ -27,61 +110,8 @@ def setup_screen():
         
 
         # Create environment based on selection
-        if env_type == "Simple 10x10":
-            env = Environment(width=10, height=10, has_border=True)
-            env.add_obstacle_rectangle(3, 3, 2, 4)
-            env.add_obstacle(6, 5)
-            env.add_obstacle(6, 6)
-            env.set_initial_state(2, 2)
-            env.set_goal_state(7, 7)
-        
-        elif env_type == "Medium 12x12":
-            env = Environment(width=12, height=12, has_border=True)
-            env.add_obstacle_rectangle(4, 4, 4, 1)
-            env.add_obstacle_rectangle(4, 7, 4, 1)
-            env.set_initial_state(2, 2)
-            env.set_goal_state(9, 9)
-        
-        elif env_type == "Complex 15x15":
-            env = Environment(width=15, height=15, has_border=True)
-
-            # 25% wall coverage with irregular maze - asymmetric gaps
-            # Creates winding paths forcing BFS/UCS to explore extensively
-
-            # --- Vertical barriers with staggered gaps ---
-            env.add_obstacle_rectangle(3, 2, 1, 4)    # x=3, y=2-5 (gap at y=1,6-13)
-            env.add_obstacle_rectangle(3, 8, 1, 4)    # x=3, y=8-11 (gap at y=7,12-13)
-
-            env.add_obstacle_rectangle(6, 1, 1, 3)    # x=6, y=1-3 (gap at y=4-13)
-            env.add_obstacle_rectangle(6, 9, 1, 4)    # x=6, y=9-12 (gap at y=4-8,13)
-
-            env.add_obstacle_rectangle(9, 3, 1, 4)    # x=9, y=3-6 (gap at y=1-2,7-13)
-            env.add_obstacle_rectangle(9, 10, 1, 3)   # x=9, y=10-12 (gap at y=7-9)
-
-            env.add_obstacle_rectangle(12, 2, 1, 5)   # x=12, y=2-6 (gap at y=1,7-13)
-            env.add_obstacle_rectangle(12, 9, 1, 2)   # x=12, y=9-10 (gap at y=7-8,11-13)
-
-            # --- Horizontal barriers with offset gaps ---
-            env.add_obstacle_rectangle(1, 5, 2, 1)    # y=5, x=1-2 (gap at x=3-13)
-            env.add_obstacle_rectangle(4, 5, 2, 1)    # y=5, x=4-5 (creates zigzag)
-
-            env.add_obstacle_rectangle(7, 7, 2, 1)    # y=7, x=7-8
-            env.add_obstacle_rectangle(10, 7, 2, 1)   # y=7, x=10-11
-
-            env.add_obstacle_rectangle(2, 11, 2, 1)   # y=11, x=2-3
-            env.add_obstacle_rectangle(5, 11, 2, 1)   # y=11, x=5-6
-            env.add_obstacle_rectangle(8, 11, 1, 1)   # y=11, x=8
-
-            # --- Strategic scattered obstacles ---
-            env.add_obstacle(4, 3)
-            env.add_obstacle(7, 4)
-            env.add_obstacle(11, 8)
-            env.add_obstacle(5, 9)
-
-            # Start & Goal
-            env.set_initial_state(1, 1)
-            env.set_goal_state(12, 12)
-
+        if env_type != "Custom":
+            env = build_preset_environment(env_type)
 
         else:  # Custom
             col1, col2 = st.columns(2)
@@ -119,7 +149,7 @@ def setup_screen():
             # Check if environment parameters have changed
             if 'custom_env_key' not in st.session_state or st.session_state.custom_env_key != custom_env_key:
                 # Environment parameters changed - regenerate obstacles
-                random.seed()  # Use current time as seed for randomness
+                rng = np.random.default_rng()  # Fresh OS entropy for every layout
 
                 env = Environment(width=width, height=height, has_border=True)
 
@@ -127,21 +157,17 @@ def setup_screen():
                 available_cells = (width - 2) * (height - 2)  # Exclude border cells
                 num_obstacles = int(available_cells * obstacle_percentage / 100)
 
-                obstacles_placed = 0
-                max_attempts = num_obstacles * 10  # Prevent infinite loop
-                attempts = 0
-
-                while obstacles_placed < num_obstacles and attempts < max_attempts:
-                    x = random.randint(1, width - 2)  # Avoid borders
-                    y = random.randint(1, height - 2)
-
-                    # Don't place obstacle on start or goal position
-                    if (x, y) != (start_x, start_y) and (x, y) != (goal_x, goal_y):
-                        if env.is_free(x, y):
-                            env.add_obstacle(x, y)
-                            obstacles_placed += 1
+                # Candidate cells: every free interior cell except start and goal
+                ys, xs = np.nonzero(env.grid[1:-1, 1:-1] == 0)
+                xs += 1
+                ys += 1
+                keep = ~(((xs == start_x) & (ys == start_y)) | ((xs == goal_x) & (ys == goal_y)))
+                xs, ys = xs[keep], ys[keep]
 
-                    attempts += 1
+                # Sample distinct cells in one call instead of retrying collisions
+                chosen = rng.choice(len(xs), size=min(num_obstacles, len(xs)), replace=False)
+                env.add_obstacles(xs[chosen], ys[chosen])
+                obstacles_placed = len(chosen)
 
                 env.set_initial_state(start_x, start_y)
                 env.set_goal_state(goal_x, goal_y)
@@ -174,7 +200,7 @@ def setup_screen():
         
         robot = Robot()
         if "8-directional" in motion:
-            robot.set_8_directional_model(straight_cost=1, diagonal_cost=1.414)
+            robot.set_8_directional_model(straight_cost=1, diagonal_cost=SQRT2)
         else:
             robot.set_4_directional_model(cost=1)
         
@@ -182,8 +208,7 @@ def setup_screen():
         st.subheader("3️⃣ Algorithm")
         algorithm_choice = st.selectbox(
             "Search Algorithm",
-            ["BFS-Graph", "DFS-Graph", "UCS-Graph", "A*-Graph",
-             "BFS-Tree", "DFS-Tree", "UCS-Tree", "A*-Tree"]
+            list(ALGORITHMS)
         )
 
         # Warning for Tree algorithms
@@ -195,7 +220,7 @@ def setup_screen():
         if "A*" in algorithm_choice:
             heuristic = st.radio(
                 "Heuristic:",
-                ["Euclidean", "Manhattan"]
+                ["Euclidean", "Manhattan", "Octile"]
             ).lower()
         
         st.markdown("---")
@@ -209,19 +234,8 @@ def setup_screen():
                 search = SearchAlgorithms(problem)
 
                 # Run selected algorithm
-                algorithm_map = {
-                    'BFS-Graph': search.bfs_graph,
-                    'DFS-Graph': search.dfs_graph,
-                    'UCS-Graph': search.ucs_graph,
-                    'A*-Graph': lambda: search.astar_graph(heuristic=heuristic),
-                    'BFS-Tree': search.bfs_tree,
-                    'DFS-Tree': search.dfs_tree,
-                    'UCS-Tree': search.ucs_tree,
-                    'A*-Tree': lambda: search.astar_tree(heuristic=heuristic),
-                }
-
                 with st.spinner(f"Running {algorithm_choice}..."):
-                    result = algorithm_map[algorithm_choice]()
+                    result = ALGORITHMS[algorithm_choice](search, heuristic)
 
                 # Store in session state
                 st.session_state.env = env
@@ -236,12 +250,18 @@ def setup_screen():
             except TimeoutError as e:
                 st.error(f"⏱️ **Timeout Error**")
                 st.warning(str(e))
-                st.info("💡 **Tip:** Tree algorithms don't track visited states and can revisit the same positions multiple times, leading to infinite loops or excessive computation. Try using the **Graph version** of this algorithm instead!")
+                if algorithm_choice == 'A*-IDA':
+                    st.info("💡 **Tip:** IDA* repeats its depth-first search from the start with a higher cost bound on every pass, trading time for memory. Try **A*-Graph** instead!")
+                else:
+                    st.info("💡 **Tip:** Tree algorithms don't track visited states and can revisit the same positions multiple times, leading to infinite loops or excessive computation. Try using the **Graph version** of this algorithm instead!")
 
             except RuntimeError as e:
                 st.error(f"🔄 **Too Many Iterations**")
                 st.warning(str(e))
-                st.info("💡 **Tip:** Tree algorithms explore states without checking if they've been visited before, which can cause exponential growth in explored nodes. Try using the **Graph version** of this algorithm instead!")
+                if algorithm_choice == 'A*-IDA':
+                    st.info("💡 **Tip:** IDA* keeps no frontier, so a single pass can revisit cells many times on large open mazes. Try **A*-Graph** instead!")
+                else:
+                    st.info("💡 **Tip:** Tree algorithms explore states without checking if they've been visited before, which can cause exponential growth in explored nodes. Try using the **Graph version** of this algorithm instead!")
 
             except Exception as e:
                 st.error(f"❌ **Error:** {str(e)}")
@@ -402,6 +422,16 @@ def visualization_screen():
     st.markdown(stats_html, unsafe_allow_html=True)
 
     # Visualization based on mode (full width)
+    render_visualization(viz_mode, animation_speed)
+
+
+@st.fragment
+def render_visualization(viz_mode, animation_speed):
+    """Render the selected visualization mode.
+
+    Runs as a fragment so the mode's own widgets (checkboxes, step slider)
+    only rerun this part instead of the whole app.
+    """
     if viz_mode == "📸 Final Result":
         show_final_result()
     elif viz_mode == "🎥 Path Animation":